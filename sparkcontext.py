@@ -1,25 +1,72 @@
 import boto3
 import os
 import asyncio
-from botocore.exceptions import ClientError
+import functools
+from boto3.s3.transfer import TransferConfig, TransferManager
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from s3transfer.subscribers import BaseSubscriber
 from typing import Optional
 
-async def upload_file(s3_client, file_path: str, bucket: str, s3_path: Optional[str] = None) -> bool:
-    file_name = os.path.basename(file_path)
+MAX_CONCURRENCY = 32
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+# Uploads handed to the transfer manager at once; beyond its submission queue upload() blocks the loop
+MAX_IN_FLIGHT = 64
+
+@functools.cache
+def _get_session() -> boto3.session.Session:
+    # Shared across uploads so credentials are resolved once per process
+    return boto3.session.Session()
+
+@functools.cache
+def _get_s3_client(region: str):
+    return _get_session().client(
+        's3',
+        region_name=region,
+        config=Config(max_pool_connections=MAX_CONCURRENCY)
+    )
+
+class _DoneSubscriber(BaseSubscriber):
+    # Hands the finished transfer back to the event loop without parking a thread on it
+    def __init__(self, loop: asyncio.AbstractEventLoop, waiter: asyncio.Future):
+        self._loop = loop
+        self._waiter = waiter
+
+    def on_done(self, future, **kwargs):
+        self._loop.call_soon_threadsafe(self._set_done, future)
+
+    def _set_done(self, future):
+        if not self._waiter.done():
+            self._waiter.set_result(future)
+
+async def upload_file(
+    transfer_manager: TransferManager,
+    limiter: asyncio.Semaphore,
+    file_path: str,
+    bucket: str,
+    s3_path: Optional[str] = None,
+    file_name: Optional[str] = None
+) -> bool:
+    file_name = file_name or os.path.basename(file_path)
     s3_key = f"{s3_path}/{file_name}" if s3_path else file_name
     
-    try:
-        await asyncio.to_thread(
-            s3_client.upload_file,
-            file_path,
-            bucket,
-            s3_key
-        )
-        print(f"Uploaded: {file_name}")
-        return True
-    except ClientError as e:
-        print(f"Error uploading {file_name}: {e}")
-        return False
+    loop = asyncio.get_running_loop()
+    async with limiter:
+        waiter = loop.create_future()
+        try:
+            transfer_manager.upload(
+                file_path,
+                bucket,
+                s3_key,
+                subscribers=[_DoneSubscriber(loop, waiter)]
+            )
+            transfer = await waiter
+            transfer.result()
+            print(f"Uploaded: {file_name}")
+            return True
+        except (ClientError, BotoCoreError, OSError) as e:
+            print(f"Error uploading {file_name}: {e}")
+            return False
 
 async def upload_directory(
     bucket_name: str,
@@ -27,16 +74,22 @@ async def upload_directory(
     s3_folder: Optional[str] = None,
     region: str = "us-east-1"
 ) -> None:
-    s3_client = boto3.client('s3', region_name=region)
-    
-    tasks = []
-    for file_name in os.listdir(local_dir):
-        file_path = os.path.join(local_dir, file_name)
-        if os.path.isfile(file_path):
-            task = upload_file(s3_client, file_path, bucket_name, s3_folder)
-            tasks.append(task)
+    s3_client = _get_s3_client(region)
+    transfer_config = TransferConfig(
+        max_concurrency=MAX_CONCURRENCY,
+        multipart_threshold=MULTIPART_THRESHOLD
+    )
     
-    results = await asyncio.gather(*tasks)
+    limiter = asyncio.Semaphore(MAX_IN_FLIGHT)
+    with TransferManager(s3_client, transfer_config) as transfer_manager:
+        tasks = []
+        with os.scandir(local_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    task = upload_file(transfer_manager, limiter, entry.path, bucket_name, s3_folder, entry.name)
+                    tasks.append(task)
+        
+        results = await asyncio.gather(*tasks)
     successful = sum(1 for r in results if r)
     print(f"\nUploaded {successful}/{len(results)} files")
 
@@ -1,16 +1,73 @@
+import asyncio
+import orjson
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
-from asyncio import create_task
 
-app = FastAPI()
+QUEUE_MAXSIZE = 10000
+BATCH_SIZE = 500
+SHUTDOWN_TIMEOUT = 10  # seconds to wait for queued events to flush
 
-async def store_event(event_data: dict):
-    pass  # Placeholder for async storage
+async def store_events(body: bytes):
+    pass  # Placeholder for async storage of an NDJSON batch
+
+async def batch_writer(queue: asyncio.Queue, in_flight: list):
+    # in_flight holds the batch being stored so shutdown can count it as unfinished
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < BATCH_SIZE:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        in_flight[:] = batch
+        try:
+            # Encode per event so one unserializable payload only costs itself
+            lines = []
+            for event in batch:
+                try:
+                    lines.append(orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE))
+                except orjson.JSONEncodeError as e:
+                    print(f"Skipping event that cannot be encoded: {e}")
+            if lines:
+                try:
+                    await store_events(b"".join(lines))
+                except Exception as e:
+                    print(f"Error storing {len(lines)} events: {e}")
+        finally:
+            in_flight.clear()
+            for _ in batch:
+                queue.task_done()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+    app.state.in_flight = []
+    app.state.writer = asyncio.create_task(batch_writer(app.state.queue, app.state.in_flight))
+    yield
+    # Flush whatever is still queued before shutting down
+    try:
+        await asyncio.wait_for(app.state.queue.join(), timeout=SHUTDOWN_TIMEOUT)
+    except asyncio.TimeoutError:
+        unfinished = app.state.queue.qsize() + len(app.state.in_flight)
+        print(f"Shutdown flush timed out; dropping {unfinished} unstored events")
+    app.state.writer.cancel()
+    with suppress(asyncio.CancelledError):
+        await app.state.writer
+
+app = FastAPI(lifespan=lifespan)
 
 # Main endpoint matching ALB path /v1/gen/user
 @app.post("/v1/gen/user")
 async def receive_event(event_data: dict):
-    create_task(store_event(event_data))
+    try:
+        app.state.queue.put_nowait(event_data)
+    except asyncio.QueueFull:
+        return JSONResponse(
+            content={"message": "too many pending events"},
+            status_code=429,
+            headers={"Content-Type": "application/json"}
+        )
     return JSONResponse(
         content={"message": "stored successfully"},
         status_code=200,